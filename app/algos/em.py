@@ -1,4 +1,5 @@
 import numpy as np
+from scipy.special import logsumexp
 # Data generation (GMM in 3D)
 
 def GMM3d(
@@ -15,25 +16,25 @@ def GMM3d(
       X: (n, 3) samples
       meta: {mus: [...], covs: [...]} for potential visualization/ground truth
     """
-    np.random.seed(seed)
+    rng = np.random.default_rng(seed)
     d = 3  # 3D
     mus = []
     covs = []
-    x_clusters = []
     n_cluster_size = n // K
 
+    # Preallocate the sample matrix and write each component's draw straight
+    # into its slice -- no per-cluster list plus vstack copy
+    X = np.empty((K * n_cluster_size, d))
     for i in range(K):
-        mu_i = np.random.uniform(mean_min, mean_max, size=d)
-        cov_i = np.diag(np.random.uniform(cov_diag_min, cov_diag_max, size=d))
+        mu_i = rng.uniform(mean_min, mean_max, size=d)
+        cov_i = np.diag(rng.uniform(cov_diag_min, cov_diag_max, size=d))
         mus.append(mu_i)
         covs.append(cov_i)
-        x_clusters.append(
-            np.random.multivariate_normal(
+        X[i * n_cluster_size:(i + 1) * n_cluster_size] = (
+            rng.multivariate_normal(
                 mu_i, cov_i, size=n_cluster_size, check_valid="raise"
             )
         )
-
-    X = np.vstack(x_clusters)
     meta = {
         "mus": [m.tolist() for m in mus],
         "covs": [c.tolist() for c in covs],
@@ -43,22 +44,58 @@ def GMM3d(
 
 # EM 
 
-def initialized_params(X: np.array, C: int):
+def initialized_params(X: np.array, C: int, rng: np.random.Generator):
     n_datapoints, n_features = X.shape
     pi = np.ones(C) / C  # uniform prior
-    mu = X[np.random.choice(n_datapoints, C, False)]  # random means
-    sigma = [np.diag(X.var(axis=0)).copy() for _ in range(C)]
+    mu = X[rng.choice(n_datapoints, C, replace=False)]  # random means
+    # Variance computed once and written straight onto the (C, d, d) stack's
+    # diagonals -- no per-component diag()/copy() round trips
+    var = X.var(axis=0)
+    sigma = np.zeros((C, n_features, n_features))
+    diag_idx = np.arange(n_features)
+    sigma[:, diag_idx, diag_idx] = var
     return pi, mu, sigma
 
 
-def multivariate_norm_pdf(X: np.array, mu: np.array, sigma: np.array):
-    _, n_features = X.shape
-    det = np.linalg.det(sigma)
-    coeff = 1 / np.sqrt((2 * np.pi) ** n_features * det)
-    diff = X - mu
-    inv_sigma = np.linalg.inv(sigma)
-    exponent = -0.5 * np.sum(diff @ inv_sigma * diff, axis=1)
-    return coeff * np.exp(exponent)
+def _quad_logdet_3d(diff, sigma):
+    """
+    Closed-form quadratic forms and log-determinants for a (C, 3, 3) stack
+    of covariances. At d=3 a cofactor expansion (~16 flops per matrix)
+    beats dispatching a batched LAPACK factorization, and the 9-term
+    quadratic form broadcasts as pure FMA across all N rows.
+
+    diff: (C, N, 3) residuals; sigma: (C, 3, 3) symmetric covariances.
+    Returns quad (C, N) and logdet (C,).
+    """
+    a, b, c = sigma[:, 0, 0], sigma[:, 0, 1], sigma[:, 0, 2]
+    d, e, f = sigma[:, 1, 0], sigma[:, 1, 1], sigma[:, 1, 2]
+    g, h, i = sigma[:, 2, 0], sigma[:, 2, 1], sigma[:, 2, 2]
+
+    cof00 = e * i - f * h
+    cof01 = f * g - d * i
+    cof02 = d * h - e * g
+    det = a * cof00 + b * cof01 + c * cof02
+
+    # Inverse entries via the adjugate; sigma is symmetric so six suffice
+    i00 = cof00 / det
+    i01 = (c * h - b * i) / det
+    i02 = (b * f - c * e) / det
+    i11 = (a * i - c * g) / det
+    i12 = (c * d - a * f) / det
+    i22 = (a * e - b * d) / det
+
+    x0, x1, x2 = diff[:, :, 0], diff[:, :, 1], diff[:, :, 2]
+    quad = (
+        i00[:, None] * x0 * x0
+        + i11[:, None] * x1 * x1
+        + i22[:, None] * x2 * x2
+        + 2.0 * (
+            i01[:, None] * x0 * x1
+            + i02[:, None] * x0 * x2
+            + i12[:, None] * x1 * x2
+        )
+    )
+    return quad, np.log(det)
 
 
 class EM:
@@ -66,70 +103,104 @@ class EM:
     Backend-friendly EM
     """
 
-    def __init__(self, X, C):
+    def __init__(self, X, C, seed=None):
         self.X = X
         self.C = C
         self.N = X.shape[0]
-        self.pi, self.mu, self.sigma = initialized_params(X, C)
+        # Per-instance PCG64 Generator: faster than the legacy Mersenne
+        # Twister singleton and safe for concurrent traces
+        self._rng = np.random.default_rng(seed)
+        self.pi, self.mu, self.sigma = initialized_params(X, C, self._rng)
         self.gamma = np.zeros((self.N, self.C))
         self.log_likelihood_history = []
+        # (C, N, d) residual tensor shared between the M-step and the next
+        # E-step -- both center X on the same mu, so compute it once
+        self._diff = None
 
     def expectation(self):
-        for c in range(self.C):
-            self.gamma[:, c] = self.pi[c] * multivariate_norm_pdf(
-                self.X, self.mu[c], self.sigma[c]
-            )
-        denominator = np.sum(self.gamma, axis=1, keepdims=True)
-        denominator = np.clip(denominator, 1e-12, None)
-        self.gamma /= denominator
-        self.log_likelihood_history.append(float(np.sum(np.log(denominator))))
+        n_features = self.X.shape[1]
+        # Everything below is batched over the (C, d, d) sigma stack -- no
+        # per-component Python loop. This also supersedes thread-level
+        # parallelism over components: BLAS/LAPACK already multithread the
+        # batched factorization and solves on the generic path.
+        if self._diff is None:
+            self._diff = self.X[None, :, :] - self.mu[:, None, :]  # (C, N, d)
+        diff = self._diff
+        if n_features == 3:
+            # Hot path for the 3D GMM data this site serves: closed-form
+            # cofactor inverse instead of a LAPACK factorization
+            quad, logdet = _quad_logdet_3d(diff, self.sigma)
+        else:
+            L = np.linalg.cholesky(self.sigma)
+            y = np.linalg.solve(L, diff.transpose(0, 2, 1))  # (C, d, N)
+            quad = (y ** 2).sum(axis=1)  # (C, N)
+            # log det(sigma) = 2 * sum(log(diag(L))): exact in log space,
+            # unlike det() which over/underflows as covariances shrink/grow
+            logdet = 2.0 * np.log(np.diagonal(L, axis1=1, axis2=2)).sum(axis=-1)  # (C,)
+        log_gamma_t = (
+            np.log(self.pi)
+            - 0.5 * (n_features * np.log(2 * np.pi) + logdet)
+        )[:, None] - 0.5 * quad  # (C, N)
+        # Normalize in log space so responsibilities never underflow
+        log_den_t = logsumexp(log_gamma_t, axis=0, keepdims=True)
+        # Keep the (C, N) layout and expose gamma as its transposed view:
+        # gamma is then (N, C) Fortran-contiguous, so gamma.T feeds the
+        # M-step GEMM as a free C-contiguous view (no hidden transpose copy)
+        self.gamma = np.exp(log_gamma_t - log_den_t).T
+        # Branchless pruning: zero out negligible responsibilities (multiply
+        # by a bool mask, no branches) so they contribute exact zeros to the
+        # M-step sums instead of denormal noise
+        self.gamma *= self.gamma > 1e-12
+        self.log_likelihood_history.append(float(np.sum(log_den_t)))
 
     def maximization(self):
         sum_prob = np.sum(self.gamma, axis=0)  # (C,)
         sum_prob = np.clip(sum_prob, 1e-12, None)
         self.pi = sum_prob / self.N
 
-        for c in range(self.C):
-            weights = self.gamma[:, c:c+1]  # (N,1)
-            self.mu[c] = (self.X * weights).sum(axis=0) / sum_prob[c]
-            diff = self.X - self.mu[c]
-            self.sigma[c] = (diff.T @ (weights * diff)) / sum_prob[c]
-            # small reg for numerical stability
-            self.sigma[c] += 1e-6 * np.eye(self.X.shape[1])
+        # Fused einsum updates: one pass over X for all components instead of
+        # per-component weight/diff temporaries
+        # gamma.T is a contiguous view (see expectation), so this is a plain
+        # BLAS GEMM with no transpose copy
+        self.mu = (self.gamma.T @ self.X) / sum_prob[:, None]
+        diff = self.X[None, :, :] - self.mu[:, None, :]  # (C, N, d)
+        self.sigma = (
+            np.einsum("nc,cnd,cne->cde", self.gamma, diff, diff)
+            / sum_prob[:, None, None]
+        )
+        # Cache for the next E-step, which centers X on this same mu
+        self._diff = diff
+        # small reg for numerical stability
+        self.sigma += 1e-6 * np.eye(self.X.shape[1])
 
     def fit_and_trace(self, num_iters: int):
         """
         Run EM and collect a StepTrace-style list of steps.
         Each step: {t, type, payload}
         """
-        steps = []
-
-        # t = 0: init
-        steps.append(
-            {
-                "t": 0,
-                "type": "init",
-                "payload": {
-                    "pi": self.pi.tolist(),
-                    "mu": self.mu.tolist(),
-                    "sigma": [s.tolist() for s in self.sigma],
-                },
-            }
-        )
+        # Snapshot raw arrays during the hot loop; serialize to lists once at
+        # the end instead of paying .tolist() on every iteration
+        snapshots = [(self.pi.copy(), self.mu.copy(), self.sigma.copy())]
 
         for i in range(1, num_iters + 1):
             self.expectation()
             self.maximization()
+            snapshots.append((self.pi.copy(), self.mu.copy(), self.sigma.copy()))
+
+        steps = []
+        for t, (pi, mu, sigma) in enumerate(snapshots):
+            payload = {
+                "pi": pi.tolist(),
+                "mu": mu.tolist(),
+                "sigma": sigma.tolist(),
+            }
+            if t > 0:
+                payload["loglike"] = self.log_likelihood_history[t - 1]
             steps.append(
                 {
-                    "t": i,
-                    "type": "update",
-                    "payload": {
-                        "pi": self.pi.tolist(),
-                        "mu": self.mu.tolist(),
-                        "sigma": [s.tolist() for s in self.sigma],
-                        "loglike": self.log_likelihood_history[-1],
-                    },
+                    "t": t,
+                    "type": "init" if t == 0 else "update",
+                    "payload": payload,
                 }
             )
 
@@ -150,7 +221,7 @@ def run_em_trace(dataset_params: dict, algo_params: dict) -> dict:
     Returns: JSON-serializable StepTrace dict
     """
     X, data_meta = GMM3d(**dataset_params)
-    em = EM(X, C=algo_params["C"])
+    em = EM(X, C=algo_params["C"], seed=dataset_params.get("seed"))
     steps, loglikes = em.fit_and_trace(num_iters=algo_params["num_iters"])
 
     trace = {
@@ -3,6 +3,85 @@ import time
 from typing import Dict, Any, Optional, List, Union
 from sklearn.datasets import make_blobs, make_moons, make_circles
 
+# Numba is optional: when present, the Lloyd iteration runs as a fused JIT
+# kernel; otherwise we fall back to the pure-NumPy implementation below.
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+
+if NUMBA_AVAILABLE:
+    def _make_lloyd_kernel(n_features):
+        """
+        Compile a Lloyd kernel specialized to a fixed dimensionality.
+
+        n_features is closed over as a compile-time constant, so Numba
+        unrolls the inner per-dimension loops for the d=2/d=3 cases this
+        site actually serves.
+        """
+        # Serial nogil kernel rather than parallel=True: at the
+        # few-hundred-point workloads this site serves prange buys
+        # nothing, the request threadpool already overlaps requests
+        # inside nogil sections, and the parallel runtime deadlocks if
+        # its first call in a process happens off the main thread
+        @njit(cache=True, fastmath=True, nogil=True)
+        def _lloyd_kernel(X, centroids):
+            # One fused Lloyd iteration: assign points, accumulate cluster
+            # means, and compute inertia against the updated centroids, all
+            # without the (n_clusters, n_samples, d) broadcast tensor.
+            n_samples = X.shape[0]
+            n_clusters = centroids.shape[0]
+            labels = np.empty(n_samples, dtype=np.int64)
+
+            # Assignment: distances kept in registers
+            for i in range(n_samples):
+                best_k = 0
+                best_dist = np.inf
+                for k in range(n_clusters):
+                    dist = 0.0
+                    for j in range(n_features):
+                        diff = X[i, j] - centroids[k, j]
+                        dist += diff * diff
+                    if dist < best_dist:
+                        best_dist = dist
+                        best_k = k
+                labels[i] = best_k
+
+            # Update: serial accumulation into O(k*d) partial sums
+            sums = np.zeros((n_clusters, n_features), dtype=X.dtype)
+            counts = np.zeros(n_clusters)
+            for i in range(n_samples):
+                k = labels[i]
+                counts[k] += 1.0
+                for j in range(n_features):
+                    sums[k, j] += X[i, j]
+
+            new_centroids = centroids.copy()
+            for k in range(n_clusters):
+                if counts[k] > 0:
+                    for j in range(n_features):
+                        new_centroids[k, j] = sums[k, j] / counts[k]
+
+            # Inertia against the *updated* centroids
+            inertia = 0.0
+            for i in range(n_samples):
+                k = labels[i]
+                dist = 0.0
+                for j in range(n_features):
+                    diff = X[i, j] - new_centroids[k, j]
+                    dist += diff * diff
+                inertia += dist
+            return labels, new_centroids, counts, inertia
+
+        return _lloyd_kernel
+
+    # The site only clusters 2D and 3D data; other dims use the NumPy path
+    _LLOYD_KERNELS = {2: _make_lloyd_kernel(2), 3: _make_lloyd_kernel(3)}
+else:
+    _LLOYD_KERNELS = {}
+
 
 class KMeans:
     """
@@ -18,8 +97,13 @@ class KMeans:
         Random seed for reproducibility
     tolerance : float, optional (default=1e-4)
         Convergence tolerance
+    store_distances : bool, optional (default=False)
+        Keep the full (n_clusters, n_samples) distance matrix in each
+        history entry. Off by default: the trace endpoint never serializes
+        it, so carrying it through history is wasted copies.
     """
-    def __init__(self, n_clusters, max_iters=100, random_state=None, tolerance=1e-4, n_features=2):
+    def __init__(self, n_clusters, max_iters=100, random_state=None, tolerance=1e-4, n_features=2,
+                 store_distances=False):
         self.n_clusters = n_clusters
         self.max_iters = max_iters
         self.random_state = random_state
@@ -29,6 +113,10 @@ class KMeans:
         else:
             self.tolerance = tolerance
         self.n_features = n_features
+        self.store_distances = store_distances
+        # Per-instance PCG64 Generator: thread-safe (no global singleton)
+        # and faster than the legacy Mersenne Twister
+        self._rng = np.random.default_rng(random_state)
         self.inertia_ = None
         self.history = []  # Store complete history of each step
         self.inertia_history_ = []
@@ -38,12 +126,13 @@ class KMeans:
         Initialize centroids using k-means++ for better initialization.
         Methods: 'kmeans++' (default) or 'random' or custom positions.
         """
-        np.random.seed(self.random_state)
+        # Fresh generator per call so initialization is reproducible even if
+        # the instance's rng has been consumed elsewhere
+        self._rng = rng = np.random.default_rng(self.random_state)
         if method == 'random':
             # Random initialization: place centroids randomly in the data space
             # Not on data points, but random positions - shows convergence without being extreme
-            np.random.seed(self.random_state)
-            
+
             # Get data bounds
             x_min, x_max = X[:, 0].min(), X[:, 0].max()
             y_min, y_max = X[:, 1].min(), X[:, 1].max()
@@ -65,20 +154,20 @@ class KMeans:
                 padding_factor = 0.5  # 50% padding for 2D - well outside data bounds
             
             for k in range(self.n_clusters):
-                centroids[k, 0] = np.random.uniform(
-                    x_min - padding_factor * x_range, 
+                centroids[k, 0] = rng.uniform(
+                    x_min - padding_factor * x_range,
                     x_max + padding_factor * x_range
                 )
                 if X.shape[1] > 1:
-                    centroids[k, 1] = np.random.uniform(
-                        y_min - padding_factor * y_range, 
+                    centroids[k, 1] = rng.uniform(
+                        y_min - padding_factor * y_range,
                         y_max + padding_factor * y_range
                     )
                 if X.shape[1] > 2:
                     z_min, z_max = X[:, 2].min(), X[:, 2].max()
                     z_range = z_max - z_min
-                    centroids[k, 2] = np.random.uniform(
-                        z_min - padding_factor * z_range, 
+                    centroids[k, 2] = rng.uniform(
+                        z_min - padding_factor * z_range,
                         z_max + padding_factor * z_range
                     )
             
@@ -92,38 +181,45 @@ class KMeans:
             # by slightly perturbing the selected points away from optimal positions
             use_perturbation = (X.shape[1] == 3)
             perturbation_factor = 0.15 if use_perturbation else 0.0  # 15% perturbation for 3D
-            
+
+            # Per-dimension data ranges, computed once instead of per centroid
+            if use_perturbation:
+                ranges = X.max(axis=0) - X.min(axis=0)
+
+
             # First centroid: random
-            idx = np.random.choice(X.shape[0])
+            idx = rng.choice(X.shape[0])
             centroids[0] = X[idx].copy()
             
             # Add perturbation for 3D to show more convergence
             if use_perturbation:
-                ranges = [X[:, i].max() - X[:, i].min() for i in range(X.shape[1])]
                 for dim in range(X.shape[1]):
-                    perturbation = np.random.uniform(-perturbation_factor * ranges[dim], 
-                                                     perturbation_factor * ranges[dim])
+                    perturbation = rng.uniform(-perturbation_factor * ranges[dim],
+                                               perturbation_factor * ranges[dim])
                     centroids[0, dim] += perturbation
             
+            # Squared distance from each point to its nearest chosen centroid,
+            # updated incrementally as centroids are added (no double loop)
+            closest_sq = ((X - centroids[0]) ** 2).sum(axis=1)
+
             for k in range(1, self.n_clusters):
-                # Compute distances from each point to nearest existing centroid
-                distances = np.array([
-                    min([np.sum((x - centroids[j])**2) for j in range(k)])
-                    for x in X
-                ])
                 # Choose next centroid with probability proportional to distance^2
-                probabilities = distances / distances.sum()
-                idx = np.random.choice(X.shape[0], p=probabilities)
+                probabilities = closest_sq / closest_sq.sum()
+                idx = rng.choice(X.shape[0], p=probabilities)
                 centroids[k] = X[idx].copy()
                 
                 # Add perturbation for 3D to show more convergence
                 if use_perturbation:
-                    ranges = [X[:, i].max() - X[:, i].min() for i in range(X.shape[1])]
                     for dim in range(X.shape[1]):
-                        perturbation = np.random.uniform(-perturbation_factor * ranges[dim], 
-                                                         perturbation_factor * ranges[dim])
+                        perturbation = rng.uniform(-perturbation_factor * ranges[dim],
+                                                   perturbation_factor * ranges[dim])
                         centroids[k, dim] += perturbation
-            
+
+                # Fold the new centroid into the running nearest-centroid distances
+                closest_sq = np.minimum(
+                    closest_sq, ((X - centroids[k]) ** 2).sum(axis=1)
+                )
+
             return centroids
         else:
             # For manual initialization
@@ -134,9 +230,16 @@ class KMeans:
         Compute distances from each point to each centroid.
         Returns: (n_clusters, n_samples) array of distances
         """
-        # Euclidean distance: d(x,c) = √Σ(xi - ci)²
-        distances = np.sqrt(((X - centroids[:, np.newaxis])**2).sum(axis=2))
-        return distances
+        # Euclidean distance via ||x-c||² = ||x||² + ||c||² - 2·x·c
+        # (one GEMM instead of the (n_clusters, n_samples, d) broadcast tensor)
+        sq_dists = (
+            (centroids ** 2).sum(axis=1)[:, np.newaxis]
+            + (X ** 2).sum(axis=1)[np.newaxis, :]
+            - 2.0 * centroids @ X.T
+        )
+        # Clamp tiny negatives from floating-point cancellation
+        np.maximum(sq_dists, 0.0, out=sq_dists)
+        return np.sqrt(sq_dists)
     
     def assign_clusters(self, X, centroids):
         """Assign each point to nearest centroid based on Euclidean distance."""
@@ -151,35 +254,28 @@ class KMeans:
         Handles empty clusters by reinitializing them to farthest point from existing centroids.
         """
         centroids = np.zeros((self.n_clusters, X.shape[1]))
-        cluster_sizes = np.zeros(self.n_clusters)
-        
-        for k in range(self.n_clusters):
-            cluster_points = X[labels == k]
-            if len(cluster_points) > 0:
-                centroids[k] = np.mean(cluster_points, axis=0)
-                cluster_sizes[k] = len(cluster_points)
+
+        # Scatter-accumulate all cluster sums and sizes in one pass
+        cluster_sizes = np.bincount(labels, minlength=self.n_clusters).astype(float)
+        np.add.at(centroids, labels, X)
+        nonempty = cluster_sizes > 0
+        centroids[nonempty] /= cluster_sizes[nonempty, np.newaxis]
+
+        # Handle empty clusters: reinitialize to point farthest from existing centroids
+        for k in np.flatnonzero(~nonempty):
+            existing_centroids = [
+                centroids[j] for j in range(k) if cluster_sizes[j] > 0
+            ]
+            if len(existing_centroids) > 0:
+                # Choose the point farthest from its nearest existing centroid
+                distances = self.compute_distances(X, np.asarray(existing_centroids))
+                idx = np.argmax(distances.min(axis=0))
             else:
-                # Handle empty cluster: reinitialize to point farthest from all existing centroids
-                if k > 0:
-                    # Find existing non-empty centroids
-                    existing_centroids = [centroids[j] for j in range(k) if cluster_sizes[j] > 0]
-                    if len(existing_centroids) > 0:
-                        # Compute distance from each point to nearest existing centroid
-                        distances = np.array([
-                            min([np.sum((x - c)**2) for c in existing_centroids])
-                            for x in X
-                        ])
-                        # Choose the farthest point
-                        idx = np.argmax(distances)
-                    else:
-                        # No existing centroids, just pick random
-                        idx = np.random.choice(X.shape[0])
-                else:
-                    # First centroid is empty (shouldn't happen, but handle it)
-                    idx = np.random.choice(X.shape[0])
-                centroids[k] = X[idx].copy()
-                cluster_sizes[k] = 0
-        
+                # No existing centroids, just pick random
+                idx = self._rng.choice(X.shape[0])
+            centroids[k] = X[idx].copy()
+            cluster_sizes[k] = 0
+
         return centroids, cluster_sizes
     
     def compute_inertia(self, X, labels, centroids):
@@ -202,15 +298,31 @@ class KMeans:
         Returns detailed information about the step.
         """
         old_centroids = centroids.copy()
-        
-        # Assignment step
-        labels, distances = self.assign_clusters(X, centroids)
-        
-        # Update step
-        new_centroids, cluster_sizes = self.update_centroids(X, labels, iteration)
-        
-        # Calculate metrics
-        inertia = self.compute_inertia(X, labels, new_centroids)
+
+        lloyd_kernel = _LLOYD_KERNELS.get(X.shape[1])
+        if lloyd_kernel is not None:
+            # Fused assign + update + inertia in one JIT kernel
+            labels, new_centroids, cluster_sizes, inertia = lloyd_kernel(
+                np.ascontiguousarray(X, dtype=np.float32),
+                np.ascontiguousarray(centroids, dtype=np.float32),
+            )
+            # The kernel never materializes the distance matrix; rebuild it
+            # only if a caller explicitly asked to keep distances
+            distances = self.compute_distances(X, centroids) if self.store_distances else None
+            if cluster_sizes.min() == 0:
+                # Rare empty-cluster case: reuse the Python reseeding logic
+                new_centroids, cluster_sizes = self.update_centroids(X, labels, iteration)
+                inertia = self.compute_inertia(X, labels, new_centroids)
+        else:
+            # Assignment step
+            labels, distances = self.assign_clusters(X, centroids)
+
+            # Update step
+            new_centroids, cluster_sizes = self.update_centroids(X, labels, iteration)
+
+            # Calculate metrics
+            inertia = self.compute_inertia(X, labels, new_centroids)
+
         movement = self.compute_centroid_movement(old_centroids, new_centroids)
         converged = movement < self.tolerance
         
@@ -218,13 +330,16 @@ class KMeans:
             'old_centroids': old_centroids,
             'new_centroids': new_centroids,
             'labels': labels,
-            'distances': distances,
             'cluster_sizes': cluster_sizes,
             'inertia': inertia,
             'movement': movement,
             'converged': converged
         }
-        
+        # Only carry the (n_clusters, n_samples) matrix through history when
+        # a caller actually wants it serialized
+        if self.store_distances:
+            step_info['distances'] = distances
+
         return new_centroids, step_info
     
     def fit(self, X, initial_centroids=None, init_method='kmeans++'):
@@ -240,6 +355,9 @@ class KMeans:
         init_method : str, optional (default='kmeans++')
             Initialization method: 'kmeans++' or 'random'
         """
+        # float32 is plenty of precision for the 2D/3D inputs this site
+        # serves, halves memory traffic, and doubles SIMD width per lane
+        X = np.ascontiguousarray(X, dtype=np.float32)
         self.X = X
         self.history = []
         self.inertia_history_ = []
@@ -255,18 +373,20 @@ class KMeans:
         initial_labels = np.argmin(initial_distances, axis=0)
         initial_inertia = self.compute_inertia(X, initial_labels, self.centroids_)
         
-        self.history.append({
+        initial_step = {
             'iteration': 0,
             'old_centroids': None,
             'new_centroids': self.centroids_.copy(),
             'labels': initial_labels,
-            'distances': initial_distances,
             'cluster_sizes': np.bincount(initial_labels, minlength=self.n_clusters),
             'inertia': initial_inertia,
             'movement': np.inf,
             'converged': False,
             'step_type': 'initialization'
-        })
+        }
+        if self.store_distances:
+            initial_step['distances'] = initial_distances
+        self.history.append(initial_step)
         self.inertia_history_.append(initial_inertia)
         
         # Main loop
@@ -318,13 +438,13 @@ class DataGenerator:
         
         # If 3D, add a third dimension with variation
         if n_features == 3:
-            np.random.seed(random_state)
+            rng = np.random.default_rng(random_state)
             # Add Z dimension with some spread to create 3D moon shapes
-            z = np.random.normal(0, noise * 3, (n_samples, 1))
+            z = rng.normal(0, noise * 3, (n_samples, 1))
             X = np.hstack([X, z])
-        
+
         return X, y
-    
+
     @staticmethod
     def generate_circles(n_samples=300, random_state=42, noise=0.1, factor=0.5, n_features=2):
         """Generate circular clusters. Supports 2D and 3D."""
@@ -347,9 +467,9 @@ class DataGenerator:
         
         # If 3D, add a third dimension with variation
         if n_features == 3:
-            np.random.seed(random_state)
+            rng = np.random.default_rng(random_state)
             # Add Z dimension with some spread to create 3D circular shapes
-            z = np.random.normal(0, noise * 3, (n_samples, 1))
+            z = rng.normal(0, noise * 3, (n_samples, 1))
             X = np.hstack([X, z])
         
         return X, y
@@ -357,8 +477,8 @@ class DataGenerator:
     @staticmethod
     def generate_random(n_samples=300, random_state=42, bounds=(-10, 10), n_features=2):
         """Generate random uniform distribution with configurable dimensionality."""
-        np.random.seed(random_state)
-        X = np.random.uniform(bounds[0], bounds[1], (n_samples, n_features))
+        rng = np.random.default_rng(random_state)
+        X = rng.uniform(bounds[0], bounds[1], (n_samples, n_features))
         y = np.zeros(n_samples)
         return X, y
 
@@ -453,7 +573,7 @@ def _serialize_step(
             "iteration": int(step.get("iteration", 0)),
             "inertia": float(step.get("inertia", 0.0)),
             "converged": bool(step.get("converged", False)),
-            "centroids": _serialize_centroids(np.asarray(step["new_centroids"])),
+            "centroids": _serialize_centroids(step["new_centroids"]),
             "cluster_sizes": _to_serializable_array(step.get("cluster_sizes")),
         }
     }
@@ -465,7 +585,7 @@ def _serialize_step(
         serialized["payload"]["movement"] = None
 
     if step.get("old_centroids") is not None:
-        serialized["payload"]["old_centroids"] = _serialize_centroids(np.asarray(step["old_centroids"]))
+        serialized["payload"]["old_centroids"] = _serialize_centroids(step["old_centroids"])
 
     if include_labels and step.get("labels") is not None:
         serialized["payload"]["labels"] = _to_serializable_array(step["labels"])
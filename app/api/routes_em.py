@@ -1,13 +1,15 @@
 # app/api/routes_em.py
 from fastapi import APIRouter
+from fastapi.concurrency import run_in_threadpool
+from app.api._json import ORJSONResponse
 from app.models.em_requests import EMRequest
 from app.algos.em import run_em_trace
 
 router = APIRouter()
 
 
-@router.post("/em", summary="Get EM StepTrace")
-def get_em_trace(req: EMRequest):
+@router.post("/em", summary="Get EM StepTrace", response_class=ORJSONResponse)
+async def get_em_trace(req: EMRequest):
     """
     Accepts dataset + algo params, calls EM and returns a StepTrace JSON
     for the EM algorithm on a 3D GMM dataset.
@@ -17,7 +19,9 @@ def get_em_trace(req: EMRequest):
     dataset_params = req.dataset.model_dump()
     algo_params = req.algo.model_dump()
 
-    trace = run_em_trace(dataset_params, algo_params)
+    # CPU-bound NumPy work: run it on the threadpool so the event loop
+    # stays free for concurrent requests (BLAS releases the GIL)
+    trace = await run_in_threadpool(run_em_trace, dataset_params, algo_params)
 
     # run_em_trace must already return a JSON-serializable dict:
     # {
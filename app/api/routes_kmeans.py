@@ -1,24 +1,23 @@
 from fastapi import APIRouter
+from fastapi.concurrency import run_in_threadpool
+from app.api._json import ORJSONResponse
 from app.models.kmeans_requests import KMeansRequest
 from app.algos.kmeans import run_kmeans_trace
 
 router = APIRouter()
 
 
-@router.post("/kmeans", summary="Get K-Means StepTrace")
-def get_kmeans_trace(req: KMeansRequest):
+@router.post("/kmeans", summary="Get K-Means StepTrace", response_class=ORJSONResponse)
+async def get_kmeans_trace(req: KMeansRequest):
     """
     Accepts dataset + algo params, calls K-Means and returns a StepTrace JSON
     for the K-Means algorithm on various dataset types (blobs, moons, circles, random).
-    
+
     req: KMeansRequest from app/models/kmeans_requests.py
     """
     dataset_params = req.dataset.model_dump()
     algo_params = req.algo.model_dump()
-    
-    # Debug logging
-    print(f"DEBUG: Received init_method: {algo_params.get('init_method', 'NOT PROVIDED')}")
-    
+
     # Convert bounds list to tuple for the algorithm
     if "bounds" in dataset_params and isinstance(dataset_params["bounds"], list):
         dataset_params["bounds"] = tuple(dataset_params["bounds"])
@@ -32,13 +31,11 @@ def get_kmeans_trace(req: KMeansRequest):
     if initial_centroids:
         initial_centroids = [tuple(c) for c in initial_centroids]  # Convert to tuples
     
-    trace = run_kmeans_trace(dataset_params, algo_params, initial_centroids=initial_centroids)
-    
-    # Debug: log initial centroids
-    if trace.get('steps') and len(trace['steps']) > 0:
-        init_centroids = trace['steps'][0]['payload']['centroids']
-        print(f"DEBUG: Initial centroids positions:")
-        for i, c in enumerate(init_centroids):
-            print(f"  C{i+1}: {c['position']}")
-    
+    # CPU-bound NumPy work: run it on the threadpool so the event loop
+    # stays free for concurrent requests (BLAS releases the GIL)
+    trace = await run_in_threadpool(
+        run_kmeans_trace, dataset_params, algo_params,
+        initial_centroids=initial_centroids,
+    )
+
     return trace
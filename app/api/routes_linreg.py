@@ -1,13 +1,15 @@
 # app/api/routes_linreg.py
 from fastapi import APIRouter
+from fastapi.concurrency import run_in_threadpool
+from app.api._json import ORJSONResponse
 from app.models.linreg_requests import LinRegRequest
 from app.algos.linreg import run_linreg_trace
 
 router = APIRouter()
 
 
-@router.post("/linreg", summary="Get Linear Regression StepTrace")
-def get_linreg_trace(req: LinRegRequest):
+@router.post("/linreg", summary="Get Linear Regression StepTrace", response_class=ORJSONResponse)
+async def get_linreg_trace(req: LinRegRequest):
     """
     Accepts dataset + algo params, calls Linear Regression and returns a StepTrace JSON
     for the Linear Regression algorithm using gradient descent.
@@ -17,7 +19,9 @@ def get_linreg_trace(req: LinRegRequest):
     dataset_params = req.dataset.model_dump()
     algo_params = req.algo.model_dump()
 
-    trace = run_linreg_trace(dataset_params, algo_params)
+    # CPU-bound NumPy work: run it on the threadpool so the event loop
+    # stays free for concurrent requests (BLAS releases the GIL)
+    trace = await run_in_threadpool(run_linreg_trace, dataset_params, algo_params)
 
     # run_linreg_trace must already return a JSON-serializable dict:
     # {
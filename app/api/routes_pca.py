@@ -1,13 +1,15 @@
 # app/api/routes_pca.py
 from fastapi import APIRouter, HTTPException
+from fastapi.concurrency import run_in_threadpool
+from app.api._json import ORJSONResponse
 from app.models.pca_requests import PCARequest
 from app.algos.pca import run_pca_trace
 
 router = APIRouter()
 
 #@router.get("/")
-@router.post("/pca", summary="Get PCA Trace")
-def get_pca_trace(req: PCARequest):
+@router.post("/pca", summary="Get PCA Trace", response_class=ORJSONResponse)
+async def get_pca_trace(req: PCARequest):
     """
     Accepts dataset + algo params, calls PCA and returns a StepTrace JSON
     for the PCA algorithm on a Gaussian-distributed dataset.
@@ -17,7 +19,9 @@ def get_pca_trace(req: PCARequest):
     try:
         dataset_params = req.dataset.model_dump()
 
-        trace = run_pca_trace(dataset_params)
+        # CPU-bound NumPy work: run it on the threadpool so the event loop
+        # stays free for concurrent requests (BLAS releases the GIL)
+        trace = await run_in_threadpool(run_pca_trace, dataset_params)
 
         # run_em_trace must already return a JSON-serializable dict:
         # {
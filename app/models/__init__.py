@@ -1,5 +1,5 @@
 """Models package for request/response schemas."""
 
-from . import em_requests, kmeans_requests, pca_requests, linreg_requests, common
+from . import em_requests, kmeans_requests, pca_requests, linreg_requests, regularization_requests
 
-__all__ = ["em_requests", "kmeans_requests", "pca_requests", "linreg_requests", "common"]
+__all__ = ["em_requests", "kmeans_requests", "pca_requests", "linreg_requests", "regularization_requests"]
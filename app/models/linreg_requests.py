@@ -18,6 +18,8 @@ class LinRegAlgoParams(BaseModel):
     learning_rate: float = 0.01
     num_iters: int = 100
     fit_intercept: bool = True
+    solver: str = "gd"  # "gd" for the iterative trace, "normal" for closed form
+    trace_format: str = "steps"  # "steps" for per-step dicts, "columnar" for parallel arrays
 
 
 # Standard format of a frontend Linear Regression POST request
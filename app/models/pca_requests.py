@@ -1,6 +1,5 @@
 from pydantic import BaseModel
-from .common import DatasetParams
-from typing import List, Optional
+from typing import List
 
 
 class PCADatasetParams(BaseModel):
@@ -1,8 +1,12 @@
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 from typing import List
 
 
 class RegularizationDatasetParams(BaseModel):
+    # Frozen models skip mutation hooks and let the route read fields
+    # straight out of __dict__ without a defensive model_dump() copy
+    model_config = ConfigDict(frozen=True)
+
     n: int = 100  # number of samples
     seed: int = 42
     true_coefficients: List[float] = [0.0, 1.0, -0.5, 0.1]  # polynomial coefficients [a0, a1, a2, ...]
@@ -12,7 +16,10 @@ class RegularizationDatasetParams(BaseModel):
 
 
 class RegularizationAlgoParams(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     regularization_type: str = "ridge"  # "ridge" or "lasso"
+    solver: str = "cd"  # lasso solver: "cd" (coordinate descent) or "gd" (subgradient descent)
     learning_rate: float = 0.001  # Smaller default for normalized features
     lambda_reg: float = 0.1  # regularization strength
     num_iters: int = 100
@@ -20,6 +27,8 @@ class RegularizationAlgoParams(BaseModel):
 
 
 class CoefficientPathParams(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     lambda_min: float = 0.01
     lambda_max: float = 10.0
     num_lambdas: int = 50
@@ -27,6 +36,8 @@ class CoefficientPathParams(BaseModel):
 
 
 class LossSurfaceParams(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     noise_level: float = 1.0
     alpha: float = 0.0
     n_samples: int = 50
@@ -47,3 +58,15 @@ class RegularizationRequest(BaseModel):
     compute_loss_surface: bool = False  # If True, compute loss surface instead
     loss_surface_params: LossSurfaceParams = None  # Optional: parameters for loss surface
 
+
+# Slim per-endpoint requests: each dedicated route validates only the
+# fields it actually uses (see routes_regularization.py)
+class RegularizationPathRequest(BaseModel):
+    dataset: RegularizationDatasetParams
+    algo: RegularizationAlgoParams
+    path_params: CoefficientPathParams = None
+
+
+class RegularizationSurfaceRequest(BaseModel):
+    loss_surface_params: LossSurfaceParams = None
+